@@ -0,0 +1,1324 @@
+import os
+import gzip
+import hashlib
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from contextlib import asynccontextmanager
+import time
+from datetime import datetime, timezone
+from dotenv import load_dotenv
+from langchain_groq import ChatGroq
+from langchain_core.prompts import ChatPromptTemplate
+from colorama import Fore, Style, init
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Callable, Hashable
+from cachetools import TTLCache
+import asyncio
+import aiohttp
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # uvloop has no Windows build; fall back to the stock asyncio loop
+    uvloop = None
+
+load_dotenv()
+init(autoreset=True)
+
+# Logging goes through a queue so stderr writes happen on a background thread,
+# never on the event loop. Set LOG_LEVEL=WARNING in production to skip the
+# per-request info messages entirely.
+logger = logging.getLogger("stockapi")
+
+def setup_logging() -> None:
+    """Attach a QueueHandler to the app logger and start its background listener"""
+    if logger.handlers:
+        return
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, stream_handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    logger.propagate = False
+    listener.start()
+    atexit.register(listener.stop)
+
+setup_logging()
+
+# Separate connect/read budgets so a slow DNS lookup or handshake can't eat the whole 10s
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_read=7)
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Create the pooled HTTP session shared by all outbound API calls"""
+    return aiohttp.ClientSession(
+        timeout=HTTP_TIMEOUT,
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
+    )
+
+async def warm_up_connections(session: aiohttp.ClientSession) -> None:
+    """Open keep-alive connections to the upstream hosts before the first request"""
+    async def head(url: str) -> None:
+        async with session.head(url):
+            pass
+
+    results = await asyncio.gather(*(head(url) for url in WARMUP_URLS), return_exceptions=True)
+    for url, result in zip(WARMUP_URLS, results):
+        if isinstance(result, Exception):
+            logger.warning("Warmup request to %s failed: %s", url, result)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open one keep-alive HTTP session per process and close it on shutdown"""
+    app.state.http = create_http_session()
+
+    # Validate API keys once at startup; /health and /analyze read the cached result
+    app.state.apis_configured = {
+        "finnhub": bool(FINNHUB_API_KEY),
+        "tavily": bool(TAVILY_API_KEY),
+        "groq": bool(GROQ_API_KEY)
+    }
+    app.state.ready = all(app.state.apis_configured.values())
+    if app.state.ready:
+        await warm_up_connections(app.state.http)
+    else:
+        missing = [name for name, configured in app.state.apis_configured.items() if not configured]
+        logger.error("Missing API keys for: %s", ", ".join(missing))
+
+    fx_task = asyncio.create_task(keep_usd_inr_rate_fresh(app.state.http))
+    try:
+        yield
+    finally:
+        fx_task.cancel()
+        await app.state.http.close()
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+# Initialize FastAPI app
+app = FastAPI(
+    title="Stock Analysis API",
+    description="Real-time stock analysis with AI-powered insights",
+    version="1.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Add CORS middleware
+# The bundled frontend is same-origin; CORS_ORIGINS lists any other sites allowed to call the API.
+#
+# Middleware must be pure ASGI (a class with `async def __call__(self, scope, receive, send)`
+# that wraps `send`). Don't use `@app.middleware("http")` or `BaseHTTPMiddleware`
+# subclasses: they buffer every response body through an extra task and add latency
+# to every request, including the streamed analysis.
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "https://stock-analyzzer.onrender.com,http://localhost:8000").split(",")
+    if origin.strip()
+]
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
+)
+
+# Environment variables
+FINNHUB_API_KEY = os.getenv("FINNHUB_API_KEY")
+TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+# Request URLs and headers, built once at import; query values go through params= so aiohttp escapes them
+FINNHUB_SEARCH_URL = "https://finnhub.io/api/v1/search"
+FINNHUB_QUOTE_URL = "https://finnhub.io/api/v1/quote"
+TAVILY_NEWS_URL = "https://api.tavily.com/v1/news"
+TAVILY_HEADERS = {"Authorization": f"Bearer {TAVILY_API_KEY}"}
+WARMUP_URLS = ("https://finnhub.io/api/v1/", "https://api.tavily.com/")
+
+# Caps on news text sent to Groq; prompt length drives LLM latency and cost
+MAX_NEWS_CHARS = 2000
+MAX_PROMPT_NEWS_CHARS = 4000
+
+# Initialize Groq client; without a key ChatGroq raises at construction, so leave it unset
+# and let /health report degraded and /analyze return 503 instead of failing the import
+groq_client = ChatGroq(api_key=GROQ_API_KEY, model_name="llama-3.1-8b-instant") if GROQ_API_KEY else None
+
+# In-process TTL caches for Finnhub lookups
+TICKER_CACHE = TTLCache(maxsize=4096, ttl=86400)
+QUOTE_CACHE = TTLCache(maxsize=4096, ttl=15)
+ANALYSIS_CACHE = TTLCache(maxsize=1024, ttl=300)
+_cache_locks: Dict[tuple, asyncio.Lock] = {}
+_cache_lock_waiters: Dict[tuple, int] = {}
+
+# Caps on in-flight upstream calls so bursts queue here instead of hitting rate limits
+_groq_sem = asyncio.Semaphore(8)
+_finnhub_sem = asyncio.Semaphore(20)
+_tavily_sem = asyncio.Semaphore(10)
+
+# Retries for upstream 429s: honour Retry-After, else back off 0.5s, 1s, 2s
+MAX_RATE_LIMIT_RETRIES = 3
+MAX_RETRY_DELAY = 4.0
+
+# Pydantic models for request/response
+class StockAnalysisRequest(BaseModel):
+    query: str
+
+class StockData(BaseModel):
+    company: str
+    ticker: str
+    price: float
+    price_inr: float
+    change: float
+    change_inr: float
+    percent: float
+    analysis: str
+    news_articles: int
+    timestamp: str
+
+class StockAnalysisResponse(BaseModel):
+    success: bool
+    data: Optional[StockData] = None
+    error: Optional[str] = None
+
+class HealthResponse(BaseModel):
+    status: str
+    timestamp: str
+    apis_configured: Dict[str, bool]
+
+# Utility functions
+_cached_timestamp = ""
+_cached_timestamp_at = float("-inf")
+
+def cached_utc_timestamp() -> str:
+    """ISO-8601 UTC timestamp, reformatted at most once per second"""
+    global _cached_timestamp, _cached_timestamp_at
+    now = time.monotonic()
+    if now - _cached_timestamp_at >= 1.0:
+        _cached_timestamp = datetime.now(timezone.utc).isoformat()
+        _cached_timestamp_at = now
+    return _cached_timestamp
+
+# USD→INR rate, refreshed hourly in the background; 82.0 is only the fallback until the first fetch
+USD_INR_RATE = 82.0
+FX_RATES_URL = "https://open.er-api.com/v6/latest/USD"
+FX_REFRESH_INTERVAL = 3600
+# Bounds for a plausible USD→INR rate; anything outside is treated as a bad upstream response
+MIN_USD_INR_RATE, MAX_USD_INR_RATE = 10.0, 500.0
+
+async def refresh_usd_inr_rate(session: aiohttp.ClientSession) -> None:
+    """Fetch the current USD→INR rate, keeping the previous rate if the fetch fails"""
+    global USD_INR_RATE
+    try:
+        async with session.get(FX_RATES_URL) as response:
+            data = orjson.loads(await response.read())
+        rate = float(data["rates"]["INR"])
+        if not MIN_USD_INR_RATE <= rate <= MAX_USD_INR_RATE:
+            logger.warning("Ignoring implausible USD→INR rate %s, keeping %s", rate, USD_INR_RATE)
+            return
+        USD_INR_RATE = rate
+        logger.info("💱 USD→INR rate updated: %s", USD_INR_RATE)
+    except Exception as e:
+        logger.warning("Error refreshing USD→INR rate, keeping %s: %s", USD_INR_RATE, e)
+
+async def keep_usd_inr_rate_fresh(session: aiohttp.ClientSession) -> None:
+    """Background task that refreshes USD_INR_RATE every FX_REFRESH_INTERVAL seconds"""
+    while True:
+        await refresh_usd_inr_rate(session)
+        await asyncio.sleep(FX_REFRESH_INTERVAL)
+
+@asynccontextmanager
+async def cache_key_lock(cache: TTLCache, key: Hashable) -> AsyncIterator[None]:
+    """Hold the per-key lock that lets only one caller fill a cache miss at a time"""
+    lock_key = (id(cache), key)
+    lock = _cache_locks.setdefault(lock_key, asyncio.Lock())
+    _cache_lock_waiters[lock_key] = _cache_lock_waiters.get(lock_key, 0) + 1
+    try:
+        async with lock:
+            yield
+    finally:
+        # Only the last waiter drops the lock, so a late arrival can't create a second one
+        _cache_lock_waiters[lock_key] -= 1
+        if _cache_lock_waiters[lock_key] == 0:
+            del _cache_lock_waiters[lock_key]
+            if _cache_locks.get(lock_key) is lock:
+                del _cache_locks[lock_key]
+
+async def cached_call(cache: TTLCache, key: Hashable, fetch: Callable[[], Awaitable[tuple]]) -> tuple:
+    """Return the cached tuple for key, or run fetch once per key and cache a successful result"""
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    async with cache_key_lock(cache, key):
+        result = cache.get(key)
+        if result is None:
+            result = await fetch()
+            if result[0] is not None:
+                cache[key] = result
+        return result
+
+async def get_with_backoff(session: aiohttp.ClientSession, sem: asyncio.Semaphore, url: str,
+                           params: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> bytes:
+    """GET url under the host's semaphore and return the body, retrying with backoff on HTTP 429"""
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        async with sem, session.get(url, params=params, headers=headers) as response:
+            if response.status != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                return await response.read()
+            retry_after = response.headers.get("Retry-After", "")
+
+        # Sleep outside the semaphore so other requests can use the slot meanwhile
+        delay = float(retry_after) if retry_after.isdigit() else 0.5 * 2 ** attempt
+        logger.warning("Rate limited by %s, retrying in %.1fs", url, min(delay, MAX_RETRY_DELAY))
+        await asyncio.sleep(min(delay, MAX_RETRY_DELAY))
+
+async def identify_ticker(session: aiohttp.ClientSession, query: str) -> tuple[Optional[str], Optional[str]]:
+    """Async function to identify ticker symbol from query, cached for 24 hours"""
+    return await cached_call(TICKER_CACHE, query.lower().strip(), lambda: _fetch_ticker(session, query))
+
+async def ticker_quote(session: aiohttp.ClientSession, ticker: str) -> tuple[Optional[float], Optional[float], Optional[float]]:
+    """Async function to get ticker price and price change, cached for a few seconds"""
+    return await cached_call(QUOTE_CACHE, ticker.upper(), lambda: _fetch_quote(session, ticker))
+
+async def _fetch_ticker(session: aiohttp.ClientSession, query: str) -> tuple[Optional[str], Optional[str]]:
+    """Async function to search Finnhub for the ticker symbol of a query"""
+    try:
+        params = {"q": query, "token": FINNHUB_API_KEY}
+        data = orjson.loads(await get_with_backoff(session, _finnhub_sem, FINNHUB_SEARCH_URL, params))
+        if data.get("count", 0) > 0:
+            symbol = data['result'][0]['symbol']
+            description = data['result'][0]['description']
+            return symbol, description
+        return None, None
+    except Exception as e:
+        logger.error("Error identifying ticker: %s", e)
+        return None, None
+
+async def _fetch_quote(session: aiohttp.ClientSession, ticker: str) -> tuple[Optional[float], Optional[float], Optional[float]]:
+    """Async function to get ticker price and price change from a single quote"""
+    try:
+        params = {"symbol": ticker, "token": FINNHUB_API_KEY}
+        data = orjson.loads(await get_with_backoff(session, _finnhub_sem, FINNHUB_QUOTE_URL, params))
+        current_price = data.get('c')
+        previous_close = data.get('pc')
+
+        if current_price is None or previous_close is None:
+            raise ValueError("Price data missing in API response")
+
+        change = current_price - previous_close
+        percent_change = (change / previous_close) * 100
+        return current_price, round(change, 2), round(percent_change, 2)
+    except Exception as e:
+        logger.error("Error fetching quote: %s", e)
+        return None, None, None
+
+async def ticker_news(session: aiohttp.ClientSession, company_name: str) -> tuple[str, list]:
+    """Async function to get ticker news"""
+    try:
+        params = {"query": company_name, "limit": 5}
+        body = await get_with_backoff(session, _tavily_sem, TAVILY_NEWS_URL, params, headers=TAVILY_HEADERS)
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            logger.error("❌ Failed to parse Tavily response: %r", body[:200])
+            return "No news available.", []
+
+        articles = data.get("articles") or data.get("results", [])
+        if not articles:
+            return "No recent news available.", []
+        
+        combined_text = " ".join(f"{a['title']}. {a.get('description', '')}" for a in articles)[:MAX_NEWS_CHARS]
+        return combined_text, articles
+    except Exception as e:
+        logger.error("Error fetching news: %s", e)
+        return "No news available.", []
+
+# Analysis prompt and chain, built once at import
+ANALYSIS_PROMPT = ChatPromptTemplate.from_template("""
+You're a financial analyst providing insights for retail investors.
+
+Analyze the recent price change of the company:
+- {price_change_info}
+
+Recent News Headlines and Context:
+{news_text}
+
+Provide a concise analysis (2-3 paragraphs) explaining:
+1. The possible reasons for this price movement based on the news
+2. Key factors that might be influencing the stock
+3. What this might mean for potential investors
+
+Keep the analysis professional but accessible to general investors. Don't introduce yourself in the response.
+""")
+ANALYSIS_CHAIN = (ANALYSIS_PROMPT | groq_client) if groq_client is not None else None
+
+ANALYSIS_UNAVAILABLE = "Unable to generate detailed analysis at this time. Please try again later."
+ANALYSIS_TRUNCATED = "\n\n[Analysis interrupted before it finished; the text above is incomplete. Please try again later.]"
+# Running analysis streams; referenced here so a client disconnect doesn't leave them to be garbage collected
+_analysis_tasks: set = set()
+
+def analysis_cache_key(ticker: str, percent: float, news_text: str) -> tuple:
+    """Key analyses by ticker, the move rounded to 0.1%, and a hash of the news they were based on"""
+    news_hash = hashlib.blake2b(news_text.encode("utf-8"), digest_size=16).hexdigest()
+    return ticker, round(percent, 1), news_hash
+
+async def summarize_with_groq(ticker: str, percent: float, news_text: str, price_change_info: str) -> str:
+    """Async function to get AI analysis using Groq, reused for a few minutes for identical inputs"""
+    news_text = news_text[:MAX_PROMPT_NEWS_CHARS]
+    key = analysis_cache_key(ticker, percent, news_text)
+    (analysis,) = await cached_call(ANALYSIS_CACHE, key, lambda: _generate_analysis(news_text, price_change_info))
+    return analysis or ANALYSIS_UNAVAILABLE
+
+async def _generate_analysis(news_text: str, price_change_info: str) -> tuple[Optional[str]]:
+    """Async function to request a fresh analysis from Groq"""
+    if ANALYSIS_CHAIN is None:
+        return (None,)
+    try:
+        async with _groq_sem:
+            response = await ANALYSIS_CHAIN.ainvoke({"news_text": news_text, "price_change_info": price_change_info})
+        
+        if hasattr(response, "content"):
+            return (response.content,)
+        elif isinstance(response, dict) and "content" in response:
+            return (response["content"],)
+        else:
+            return (str(response),)
+    except Exception as e:
+        logger.error("Error with Groq analysis: %s", e)
+        return (None,)
+
+async def stream_groq_analysis(ticker: str, percent: float, news_text: str, price_change_info: str) -> AsyncIterator[str]:
+    """Async generator yielding the Groq analysis as it is generated, or all at once if cached"""
+    news_text = news_text[:MAX_PROMPT_NEWS_CHARS]
+    key = analysis_cache_key(ticker, percent, news_text)
+    cached = ANALYSIS_CACHE.get(key)
+    if cached is not None:
+        yield cached[0]
+        return
+    if ANALYSIS_CHAIN is None:
+        yield ANALYSIS_UNAVAILABLE
+        return
+
+    # Groq is drained by a separate task so the Groq slot and the per-key lock are released
+    # as soon as generation ends, not when this client gets round to reading the last chunk
+    queue: asyncio.Queue = asyncio.Queue()
+    task = asyncio.create_task(_produce_analysis(key, news_text, price_change_info, queue))
+    _analysis_tasks.add(task)
+    task.add_done_callback(_analysis_tasks.discard)
+    while (chunk := await queue.get()) is not None:
+        yield chunk
+
+async def _produce_analysis(key: tuple, news_text: str, price_change_info: str, queue: asyncio.Queue) -> None:
+    """Stream a Groq analysis into queue, ending with None, and cache the full text if it completes"""
+    try:
+        # Concurrent misses for the same key wait here, then replay the first stream's result in one chunk
+        async with cache_key_lock(ANALYSIS_CACHE, key):
+            cached = ANALYSIS_CACHE.get(key)
+            if cached is not None:
+                queue.put_nowait(cached[0])
+                return
+
+            chunks = []
+            try:
+                async with _groq_sem:
+                    async for chunk in ANALYSIS_CHAIN.astream({"news_text": news_text, "price_change_info": price_change_info}):
+                        if chunk.content:
+                            chunks.append(chunk.content)
+                            queue.put_nowait(chunk.content)
+            except Exception as e:
+                logger.error("Error streaming Groq analysis: %s", e)
+                # Part of the text may already be on the wire, so flag it as cut off rather than unavailable
+                queue.put_nowait(ANALYSIS_TRUNCATED if chunks else ANALYSIS_UNAVAILABLE)
+                return
+
+            ANALYSIS_CACHE[key] = ("".join(chunks),)
+    finally:
+        queue.put_nowait(None)
+
+def format_price_change_info(data: Dict[str, Any]) -> str:
+    """Describe the price change of a stock snapshot for the analysis prompt"""
+    return f"Price changed by {data['change']} USD ({data['percent']:.2f}%) for {data['company']} ({data['ticker']})"
+
+async def fetch_stock_snapshot(session: aiohttp.ClientSession, query: str) -> Dict[str, Any]:
+    """Async function that fetches ticker, quote and news for a query, without the AI analysis"""
+    # Step 1: Identify ticker
+    ticker, company = await identify_ticker(session, query)
+    if not ticker:
+        return {
+            "success": False,
+            "error": "❌ Couldn't identify a valid company in your query. Please try a different company name or ticker symbol."
+        }
+
+    logger.info("🔍 Identified Ticker: %s for Company: %s", ticker, company)
+
+    # Step 2: Fetch quote and news concurrently; a news failure shouldn't sink the quote
+    quote, news = await asyncio.gather(
+        ticker_quote(session, ticker),
+        ticker_news(session, company),
+        return_exceptions=True
+    )
+    if isinstance(news, Exception):
+        logger.warning("Error fetching news: %s", news)
+        news = ("No news available.", [])
+    news_text, articles = news
+
+    if isinstance(quote, Exception):
+        logger.warning("Error fetching quote: %s", quote)
+        quote = (None, None, None)
+    if quote[0] is None:
+        return {
+            "success": False,
+            "error": "❌ Unable to fetch current price data. Please try again later."
+        }
+
+    price, change, percent = quote
+
+    # Step 3: Convert price and change to INR
+    price_inr, change_inr = round(price * USD_INR_RATE, 2), round(change * USD_INR_RATE, 2)
+    logger.info("💰 Current Price: $%s / ₹%s", price, price_inr)
+    logger.info("📈 Price Change: %+.2f$ / %+.2f₹ (%.2f%%)", change, change_inr, percent)
+
+    return {
+        "success": True,
+        "data": {
+            "company": company,
+            "ticker": ticker,
+            "price": round(price, 2),
+            "price_inr": price_inr,
+            "change": round(change, 2),
+            "change_inr": change_inr,
+            "percent": round(percent, 2),
+            "news_articles": len(articles)
+        },
+        "news_text": news_text
+    }
+
+async def analyze_stock_data(session: aiohttp.ClientSession, query: str) -> Dict[str, Any]:
+    """Main async function that analyzes stock data and returns structured response"""
+    try:
+        snapshot = await fetch_stock_snapshot(session, query)
+        if not snapshot["success"]:
+            return snapshot
+
+        # Step 4: Get analysis
+        data = snapshot["data"]
+        data["analysis"] = await summarize_with_groq(
+            data["ticker"], data["percent"], snapshot["news_text"], format_price_change_info(data)
+        )
+        
+        logger.info("📊 Analysis generated successfully")
+
+        # Return structured response
+        data["timestamp"] = datetime.now(timezone.utc).isoformat()
+        return {"success": True, "data": data}
+
+    except Exception as e:
+        logger.error("Error in analyze_stock_data: %s", e)
+        return {
+            "success": False,
+            "error": f"❌ An unexpected error occurred: {str(e)}"
+        }
+
+# HTML Content
+def get_html_content():
+    return """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Stock Market Analyzer</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            color: #333;
+            overflow-x: hidden;
+        }
+
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+
+        .header {
+            text-align: center;
+            margin-bottom: 40px;
+            animation: fadeInDown 1s ease-out;
+        }
+
+        .header h1 {
+            font-size: 3rem;
+            color: white;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+            margin-bottom: 10px;
+        }
+
+        .header p {
+            color: rgba(255,255,255,0.9);
+            font-size: 1.2rem;
+        }
+
+        .search-section {
+            background: rgba(255,255,255,0.95);
+            border-radius: 20px;
+            padding: 30px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+            margin-bottom: 30px;
+            backdrop-filter: blur(10px);
+            animation: fadeInUp 1s ease-out 0.3s both;
+        }
+
+        .search-box {
+            display: flex;
+            gap: 15px;
+            margin-bottom: 20px;
+        }
+
+        .search-input {
+            flex: 1;
+            padding: 15px 20px;
+            border: 2px solid #e1e8ed;
+            border-radius: 50px;
+            font-size: 1.1rem;
+            outline: none;
+            transition: all 0.3s ease;
+            background: white;
+        }
+
+        .search-input:focus {
+            border-color: #667eea;
+            transform: translateY(-2px);
+            box-shadow: 0 10px 20px rgba(102, 126, 234, 0.2);
+        }
+
+        .search-btn {
+            padding: 15px 30px;
+            background: linear-gradient(45deg, #667eea, #764ba2);
+            color: white;
+            border: none;
+            border-radius: 50px;
+            font-size: 1.1rem;
+            font-weight: 600;
+            cursor: pointer;
+            transition: all 0.3s ease;
+            box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+        }
+
+        .search-btn:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 8px 25px rgba(102, 126, 234, 0.4);
+        }
+
+        .search-btn:disabled {
+            opacity: 0.6;
+            cursor: not-allowed;
+            transform: none;
+        }
+
+        .loading {
+            display: none;
+            text-align: center;
+            margin: 20px 0;
+            color: #667eea;
+        }
+
+        .spinner {
+            width: 40px;
+            height: 40px;
+            border: 4px solid #f3f3f3;
+            border-top: 4px solid #667eea;
+            border-radius: 50%;
+            animation: spin 1s linear infinite;
+            margin: 0 auto 10px;
+        }
+
+        .results-section {
+            display: none;
+            animation: slideInUp 0.8s ease-out;
+        }
+
+        .stock-card {
+            background: rgba(255,255,255,0.95);
+            border-radius: 20px;
+            padding: 30px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+            backdrop-filter: blur(10px);
+            margin-bottom: 20px;
+        }
+
+        .stock-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 30px;
+            padding-bottom: 20px;
+            border-bottom: 2px solid #f0f0f0;
+        }
+
+        .stock-title {
+            font-size: 2rem;
+            color: #333;
+            font-weight: 700;
+        }
+
+        .stock-ticker {
+            background: linear-gradient(45deg, #667eea, #764ba2);
+            color: white;
+            padding: 8px 16px;
+            border-radius: 20px;
+            font-weight: 600;
+            font-size: 1.1rem;
+        }
+
+        .price-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+
+        .price-card {
+            background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+            border-radius: 15px;
+            padding: 20px;
+            text-align: center;
+            transition: transform 0.3s ease;
+        }
+
+        .price-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 10px 25px rgba(0,0,0,0.1);
+        }
+
+        .price-label {
+            color: #666;
+            font-size: 0.9rem;
+            margin-bottom: 8px;
+            text-transform: uppercase;
+            font-weight: 600;
+        }
+
+        .price-value {
+            font-size: 1.8rem;
+            font-weight: 700;
+            color: #333;
+        }
+
+        .price-change {
+            margin-top: 5px;
+            font-size: 1.1rem;
+            font-weight: 600;
+        }
+
+        .positive { color: #28a745; }
+        .negative { color: #dc3545; }
+
+        .analysis-section {
+            background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+            border-radius: 15px;
+            padding: 25px;
+            margin-top: 20px;
+        }
+
+        .analysis-title {
+            font-size: 1.5rem;
+            color: #333;
+            margin-bottom: 15px;
+            display: flex;
+            align-items: center;
+            gap: 10px;
+        }
+
+        .analysis-content {
+            line-height: 1.6;
+            color: #555;
+            font-size: 1.1rem;
+        }
+
+        .error-message {
+            background: #ffe6e6;
+            color: #d63384;
+            padding: 15px 20px;
+            border-radius: 10px;
+            border-left: 4px solid #d63384;
+            margin: 20px 0;
+            display: none;
+        }
+
+        .demo-section {
+            background: rgba(255,255,255,0.1);
+            border-radius: 15px;
+            padding: 20px;
+            margin-top: 20px;
+            text-align: center;
+        }
+
+        .demo-title {
+            color: white;
+            font-size: 1.3rem;
+            margin-bottom: 15px;
+        }
+
+        .demo-buttons {
+            display: flex;
+            gap: 10px;
+            justify-content: center;
+            flex-wrap: wrap;
+        }
+
+        .demo-btn {
+            padding: 10px 20px;
+            background: rgba(255,255,255,0.2);
+            color: white;
+            border: 1px solid rgba(255,255,255,0.3);
+            border-radius: 25px;
+            cursor: pointer;
+            transition: all 0.3s ease;
+            font-size: 0.9rem;
+        }
+
+        .demo-btn:hover {
+            background: rgba(255,255,255,0.3);
+            transform: translateY(-2px);
+        }
+
+        .api-info {
+            background: rgba(255,255,255,0.1);
+            border-radius: 15px;
+            padding: 20px;
+            margin-bottom: 20px;
+            text-align: center;
+            color: white;
+        }
+
+        .api-links {
+            display: flex;
+            gap: 15px;
+            justify-content: center;
+            flex-wrap: wrap;
+            margin-top: 15px;
+        }
+
+        .api-link {
+            background: rgba(255,255,255,0.2);
+            color: white;
+            padding: 8px 16px;
+            border-radius: 20px;
+            text-decoration: none;
+            transition: all 0.3s ease;
+            font-size: 0.9rem;
+        }
+
+        .api-link:hover {
+            background: rgba(255,255,255,0.3);
+            transform: translateY(-2px);
+        }
+
+        @keyframes fadeInDown {
+            from {
+                opacity: 0;
+                transform: translateY(-30px);
+            }
+            to {
+                opacity: 1;
+                transform: translateY(0);
+            }
+        }
+
+        @keyframes fadeInUp {
+            from {
+                opacity: 0;
+                transform: translateY(30px);
+            }
+            to {
+                opacity: 1;
+                transform: translateY(0);
+            }
+        }
+
+        @keyframes slideInUp {
+            from {
+                opacity: 0;
+                transform: translateY(50px);
+            }
+            to {
+                opacity: 1;
+                transform: translateY(0);
+            }
+        }
+
+        @keyframes spin {
+            0% { transform: rotate(0deg); }
+            100% { transform: rotate(360deg); }
+        }
+
+        @media (max-width: 768px) {
+            .header h1 {
+                font-size: 2rem;
+            }
+            
+            .search-box {
+                flex-direction: column;
+            }
+            
+            .stock-header {
+                flex-direction: column;
+                gap: 15px;
+                text-align: center;
+            }
+            
+            .price-grid {
+                grid-template-columns: 1fr;
+            }
+
+            .demo-buttons, .api-links {
+                flex-direction: column;
+                align-items: center;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📈 Stock Market Analyzer</h1>
+            <p>Real-time stock analysis with AI-powered insights</p>
+        </div>
+
+        <div class="api-info">
+            <div>🚀 <strong>FastAPI Backend Integration Active</strong></div>
+            <div class="api-links">
+                <a href="/docs" class="api-link" target="_blank">📖 API Documentation</a>
+                <a href="/redoc" class="api-link" target="_blank">📘 Alternative Docs</a>
+                <a href="/health" class="api-link" target="_blank">🏥 Health Check</a>
+            </div>
+        </div>
+
+        <div class="search-section">
+            <div class="search-box">
+                <input 
+                    type="text" 
+                    id="searchInput" 
+                    class="search-input" 
+                    placeholder="Enter company name or ticker symbol (e.g., Apple, TSLA, Microsoft)"
+                    onkeypress="handleEnter(event)"
+                />
+                <button id="searchBtn" class="search-btn" onclick="analyzeStock()">
+                    🔍 Analyze Stock
+                </button>
+            </div>
+
+            <div class="demo-section">
+                <div class="demo-title">Try these examples:</div>
+                <div class="demo-buttons">
+                    <button class="demo-btn" onclick="fillSearch('Apple')">Apple</button>
+                    <button class="demo-btn" onclick="fillSearch('Tesla')">Tesla</button>
+                    <button class="demo-btn" onclick="fillSearch('Microsoft')">Microsoft</button>
+                    <button class="demo-btn" onclick="fillSearch('Google')">Google</button>
+                    <button class="demo-btn" onclick="fillSearch('Amazon')">Amazon</button>
+                </div>
+            </div>
+
+            <div class="loading" id="loading">
+                <div class="spinner"></div>
+                <div>Analyzing stock data...</div>
+            </div>
+
+            <div class="error-message" id="errorMessage"></div>
+        </div>
+
+        <div class="results-section" id="results">
+            <div class="stock-card">
+                <div class="stock-header">
+                    <div class="stock-title" id="companyName">Company Name</div>
+                    <div class="stock-ticker" id="tickerSymbol">TICKER</div>
+                </div>
+
+                <div class="price-grid">
+                    <div class="price-card">
+                        <div class="price-label">💰 Current Price (USD)</div>
+                        <div class="price-value" id="priceUSD">$0.00</div>
+                    </div>
+                    <div class="price-card">
+                        <div class="price-label">💰 Current Price (INR)</div>
+                        <div class="price-value" id="priceINR">₹0.00</div>
+                    </div>
+                    <div class="price-card">
+                        <div class="price-label">📈 Change (USD)</div>
+                        <div class="price-value price-change" id="changeUSD">$0.00</div>
+                    </div>
+                    <div class="price-card">
+                        <div class="price-label">📈 Change (INR)</div>
+                        <div class="price-value price-change" id="changeINR">₹0.00</div>
+                    </div>
+                </div>
+
+                <div class="analysis-section">
+                    <div class="analysis-title">
+                        🧠 AI Analysis & Market Insights
+                    </div>
+                    <div class="analysis-content" id="analysisContent">
+                        Analysis will appear here...
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <script>
+        // Get the current host dynamically
+        const API_BASE_URL = window.location.origin;
+
+        async function analyzeStock() {
+            const query = document.getElementById('searchInput').value.trim();
+            if (!query) {
+                showError('Please enter a company name or ticker symbol');
+                return;
+            }
+            // Enter bypasses the disabled button, so don't start a second stream mid-analysis
+            if (document.getElementById('searchBtn').disabled) {
+                return;
+            }
+
+            setLoading(true);
+            hideError();
+
+            try {
+                const response = await fetch(`${API_BASE_URL}/analyze/stream`, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({ query: query })
+                });
+
+                if (!response.ok) {
+                    const result = await response.json();
+                    showError(result.detail || 'An error occurred while analyzing the stock');
+                    return;
+                }
+
+                // The body is a Server-Sent Events stream: market data first, then analysis chunks
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                const analysisElement = document.getElementById('analysisContent');
+                let buffer = '';
+
+                while (true) {
+                    const { done, value } = await reader.read();
+                    if (done) break;
+
+                    buffer += decoder.decode(value, { stream: true });
+                    const events = buffer.split('\\n\\n');
+                    buffer = events.pop();
+
+                    for (const rawEvent of events) {
+                        let eventName = 'message';
+                        let eventData = '';
+                        for (const line of rawEvent.split('\\n')) {
+                            if (line.startsWith('event: ')) eventName = line.slice(7);
+                            else if (line.startsWith('data: ')) eventData += line.slice(6);
+                        }
+
+                        if (eventName === 'data') {
+                            displayResults({ ...JSON.parse(eventData), analysis: '' });
+                            // Hide only the spinner; the button stays disabled until the stream ends
+                            document.getElementById('loading').style.display = 'none';
+                        } else if (eventName === 'analysis') {
+                            analysisElement.textContent += JSON.parse(eventData);
+                        }
+                    }
+                }
+            } catch (error) {
+                console.error('API Error:', error);
+                showError('Network error: ' + error.message);
+            } finally {
+                setLoading(false);
+            }
+        }
+
+        function displayResults(data) {
+            document.getElementById('companyName').textContent = data.company;
+            document.getElementById('tickerSymbol').textContent = data.ticker;
+            document.getElementById('priceUSD').textContent = `$${data.price}`;
+            document.getElementById('priceINR').textContent = `₹${data.price_inr}`;
+            
+            const changeUSDElement = document.getElementById('changeUSD');
+            const changeINRElement = document.getElementById('changeINR');
+            
+            const changeSign = data.change >= 0 ? '+' : '';
+            changeUSDElement.textContent = `${changeSign}$${data.change} (${data.percent}%)`;
+            changeINRElement.textContent = `${changeSign}₹${data.change_inr} (${data.percent}%)`;
+            
+            // Apply color classes
+            const colorClass = data.change >= 0 ? 'positive' : 'negative';
+            changeUSDElement.className = `price-value price-change ${colorClass}`;
+            changeINRElement.className = `price-value price-change ${colorClass}`;
+            
+            document.getElementById('analysisContent').textContent = data.analysis;
+            document.getElementById('results').style.display = 'block';
+        }
+
+        function setLoading(isLoading) {
+            const loadingElement = document.getElementById('loading');
+            const searchBtn = document.getElementById('searchBtn');
+            
+            if (isLoading) {
+                loadingElement.style.display = 'block';
+                searchBtn.disabled = true;
+                searchBtn.textContent = 'Analyzing...';
+            } else {
+                loadingElement.style.display = 'none';
+                searchBtn.disabled = false;
+                searchBtn.textContent = '🔍 Analyze Stock';
+            }
+        }
+
+        function showError(message) {
+            const errorElement = document.getElementById('errorMessage');
+            errorElement.textContent = message;
+            errorElement.style.display = 'block';
+        }
+
+        function hideError() {
+            document.getElementById('errorMessage').style.display = 'none';
+        }
+
+        function handleEnter(event) {
+            if (event.key === 'Enter') {
+                analyzeStock();
+            }
+        }
+
+        function fillSearch(company) {
+            document.getElementById('searchInput').value = company;
+        }
+
+        // Health check for backend connection
+        async function checkBackendHealth() {
+            try {
+                const response = await fetch(`${API_BASE_URL}/health`);
+                const data = await response.json();
+                console.log('Backend health:', data);
+                return true;
+            } catch (error) {
+                console.warn('Backend health check failed:', error.message);
+                return false;
+            }
+        }
+
+        // Add some interactive effects
+        document.addEventListener('DOMContentLoaded', function() {
+            // Check backend health on page load
+            checkBackendHealth().then(isHealthy => {
+                if (isHealthy) {
+                    console.log('✅ FastAPI backend is running and healthy!');
+                } else {
+                    showError('Backend health check failed. Some features may not work properly.');
+                }
+            });
+
+            // Add focus effect to search input
+            const searchInput = document.getElementById('searchInput');
+            searchInput.addEventListener('focus', function() {
+                this.parentElement.style.transform = 'scale(1.02)';
+            });
+            
+            searchInput.addEventListener('blur', function() {
+                this.parentElement.style.transform = 'scale(1)';
+            });
+        });
+    </script>
+</body>
+</html>
+"""
+
+# Encode (and gzip) the frontend once at import instead of on every request
+_HTML_BYTES = get_html_content().encode("utf-8")
+_HTML_GZIP_BYTES = gzip.compress(_HTML_BYTES)
+
+# The page only changes between deploys, so let browsers and CDNs revalidate by ETag
+_HTML_DIGEST = hashlib.md5(_HTML_BYTES).hexdigest()
+_HTML_ETAG = f'"{_HTML_DIGEST}"'
+_HTML_GZIP_ETAG = f'"{_HTML_DIGEST}-gzip"'
+_HTML_CACHE_HEADERS = {"Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+
+# FastAPI Routes
+
+@app.get("/")
+async def serve_frontend(request: Request):
+    """
+    Serve the integrated HTML frontend
+    """
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "")
+    etag = _HTML_GZIP_ETAG if use_gzip else _HTML_ETAG
+    headers = {**_HTML_CACHE_HEADERS, "ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    if use_gzip:
+        return HTMLResponse(content=_HTML_GZIP_BYTES, headers={**headers, "Content-Encoding": "gzip"})
+    return HTMLResponse(content=_HTML_BYTES, headers=headers)
+
+@app.post("/analyze", response_model=StockAnalysisResponse)
+async def analyze_stock_endpoint(request: StockAnalysisRequest, http_request: Request):
+    """
+    Analyze stock data for a given company or ticker
+    
+    - **query**: Company name or ticker symbol (e.g., "Apple", "TSLA", "Microsoft")
+    
+    Returns real-time stock data with AI-powered analysis
+    """
+    if not request.query.strip():
+        raise HTTPException(status_code=400, detail="Query parameter cannot be empty")
+
+    if not http_request.app.state.ready:
+        raise HTTPException(status_code=503, detail="❌ The server is missing API keys. Please check its configuration.")
+
+    logger.info("🔎 API Request: Analyzing '%s'", request.query)
+    
+    try:
+        result = await analyze_stock_data(http_request.app.state.http, request.query.strip())
+        
+        if result["success"]:
+            logger.info("✅ Analysis completed successfully")
+            # result["data"] is built by our own code, so skip re-validating it;
+            # response_model is kept on the route for the OpenAPI schema
+            return ORJSONResponse(content=result)
+        else:
+            logger.warning("❌ Analysis failed: %s", result["error"])
+            raise HTTPException(status_code=400, detail=result["error"])
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("API Error: %s", e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@app.post("/analyze/stream")
+async def analyze_stock_stream_endpoint(request: StockAnalysisRequest, http_request: Request):
+    """
+    Analyze stock data for a given company or ticker, streaming the AI analysis
+
+    Returns Server-Sent Events: a `data` event with the market data as soon as it
+    is fetched, `analysis` events carrying JSON-encoded text chunks as the analysis
+    is generated, and a final `done` event
+    """
+    if not request.query.strip():
+        raise HTTPException(status_code=400, detail="Query parameter cannot be empty")
+
+    if not http_request.app.state.ready:
+        raise HTTPException(status_code=503, detail="❌ The server is missing API keys. Please check its configuration.")
+
+    logger.info("🔎 API Stream Request: Analyzing '%s'", request.query)
+
+    try:
+        snapshot = await fetch_stock_snapshot(http_request.app.state.http, request.query.strip())
+        if not snapshot["success"]:
+            logger.warning("❌ Analysis failed: %s", snapshot["error"])
+            raise HTTPException(status_code=400, detail=snapshot["error"])
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("API Error: %s", e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    data = snapshot["data"]
+    data["timestamp"] = datetime.now(timezone.utc).isoformat()
+
+    async def stream_events():
+        yield b"event: data\ndata: " + orjson.dumps(data) + b"\n\n"
+        analysis_chunks = stream_groq_analysis(
+            data["ticker"], data["percent"], snapshot["news_text"], format_price_change_info(data)
+        )
+        async for chunk in analysis_chunks:
+            yield b"event: analysis\ndata: " + orjson.dumps(chunk) + b"\n\n"
+        yield b"event: done\ndata: {}\n\n"
+
+    return StreamingResponse(
+        stream_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/health", response_model=HealthResponse)
+async def health_check(request: Request):
+    """Health check endpoint to verify API status and configuration"""
+    # Built from trusted server state, so skip HealthResponse validation (the model documents the schema)
+    return ORJSONResponse(content={
+        "status": "healthy" if request.app.state.ready else "degraded",
+        "timestamp": cached_utc_timestamp(),
+        "apis_configured": request.app.state.apis_configured
+    })
+
+# Original CLI function (preserved for backward compatibility)
+async def _analyze_stock_once(query: str) -> Dict[str, Any]:
+    """Run a single analysis with a short-lived session outside the FastAPI lifespan"""
+    async with create_http_session() as session:
+        await refresh_usd_inr_rate(session)
+        return await analyze_stock_data(session, query)
+
+def run_async(coro: Awaitable[Any]) -> Any:
+    """Run a coroutine to completion on uvloop when it is installed, else on the default asyncio loop"""
+    return uvloop.run(coro) if uvloop is not None else asyncio.run(coro)
+
+def analyze_stock_cli(query: str):
+    """Original function for CLI usage - runs async function in sync context"""
+    print_stock_analysis(run_async(_analyze_stock_once(query)))
+
+def print_stock_analysis(result: Dict[str, Any]):
+    """Print an analyze_stock_data result for the CLI"""
+    if result["success"]:
+        data = result["data"]
+        print(f"{Fore.CYAN}🔍 Identified Ticker: {data['ticker']} for Company: {data['company']}")
+        print(f"{Fore.GREEN}💰 Current Price: ${data['price']} / ₹{data['price_inr']}")
+        
+        change_symbol = "+" if data['change'] >= 0 else ""
+        print(f"{Fore.YELLOW}📈 Price Change: {change_symbol}${data['change']} / {change_symbol}₹{data['change_inr']} ({data['percent']:.2f}%)")
+        print(f"{Fore.MAGENTA}📊 Ticker Analysis:\n{data['analysis']}")
+        
+        print(Style.BRIGHT + f"\n📈 Final Summary for {data['company']} ({data['ticker']}):")
+        print(f"✅ Price: ${data['price']} / ₹{data['price_inr']}")
+        print(f"📉 Change: {change_symbol}${data['change']} / {change_symbol}₹{data['change_inr']} ({data['percent']:.2f}%)")
+        print(f"🧠 Analysis:\n{data['analysis']}")
+    else:
+        print(Fore.RED + result["error"])
+
+async def run_cli():
+    """Interactive CLI loop that reuses one pooled HTTP session across queries"""
+    async with create_http_session() as session:
+        await refresh_usd_inr_rate(session)
+        while True:
+            query = await asyncio.to_thread(input, Fore.BLUE + "🔎 Enter your stock-related query (or 'exit' to quit): ")
+            if query.lower() == "exit":
+                break
+            print_stock_analysis(await analyze_stock_data(session, query))
+            print("\n" + "-" * 60 + "\n")
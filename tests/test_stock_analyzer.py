@@ -0,0 +1,91 @@
+import asyncio
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from cachetools import TTLCache
+from fastapi.testclient import TestClient
+
+import stock_analyzer
+
+
+def test_cached_call_coalesces_concurrent_misses():
+    """Concurrent misses for one key run a single fetch and leave no lock behind"""
+    cache = TTLCache(maxsize=8, ttl=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ("AAPL", "Apple Inc")
+
+    async def run():
+        return await asyncio.gather(*(stock_analyzer.cached_call(cache, "apple", fetch) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert results == [("AAPL", "Apple Inc")] * 5
+    assert len(calls) == 1
+    assert cache["apple"] == ("AAPL", "Apple Inc")
+    assert stock_analyzer._cache_locks == {}
+    assert stock_analyzer._cache_lock_waiters == {}
+
+
+def test_cached_call_does_not_cache_failures():
+    """A failed fetch is returned to its waiters but not cached, and its lock is still cleaned up"""
+    cache = TTLCache(maxsize=8, ttl=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return (None, None)
+
+    async def run():
+        return await asyncio.gather(*(stock_analyzer.cached_call(cache, "nope", fetch) for _ in range(3)))
+
+    results = asyncio.run(run())
+
+    assert results == [(None, None)] * 3
+    assert len(calls) == 3
+    assert "nope" not in cache
+    assert stock_analyzer._cache_locks == {}
+    assert stock_analyzer._cache_lock_waiters == {}
+
+
+def test_get_with_backoff_retries_rate_limited_requests():
+    """An upstream 429 is retried and the next successful body is returned"""
+    hits = []
+
+    async def quote(request):
+        hits.append(request.query["symbol"])
+        if len(hits) == 1:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response({"c": 110.0, "pc": 100.0})
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/quote", quote)
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            return await stock_analyzer.get_with_backoff(
+                session, asyncio.Semaphore(1), str(server.make_url("/quote")), {"symbol": "AAPL"}
+            )
+
+    body = asyncio.run(run())
+
+    assert stock_analyzer.orjson.loads(body) == {"c": 110.0, "pc": 100.0}
+    assert hits == ["AAPL", "AAPL"]
+
+
+def test_frontend_revalidation_returns_304():
+    """A request carrying the frontend's current ETag gets an empty 304"""
+    client = TestClient(stock_analyzer.app)
+
+    first = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    second = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.content == b""